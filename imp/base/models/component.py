@@ -19,6 +19,8 @@ limitations under the License.
 class Component:
   """Base class for any part of our component model."""
 
+  __slots__ = ("parent",)
+
   def __init__(self):
     self.parent = None
 
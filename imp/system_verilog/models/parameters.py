@@ -16,9 +16,74 @@ parameters including regular parameters and local parameters. Each parameter typ
 maintains proper type information and values according to SystemVerilog specifications.
 """
 
-from typing import Any, List
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NoReturn
 from imp.base.models import component
-from imp.base.models.datatypes import DataType
+
+if TYPE_CHECKING:
+    from imp.base.models.datatypes import DataType
+
+_EMPTY_PARAM_NAME_MSG = "Parameter name cannot be empty"
+_EMPTY_LOCALPARAM_NAME_MSG = "LocalParam name cannot be empty"
+_EMPTY_NAMES_MSG = "Names list cannot be empty"
+
+_PARAM_FMT = "Parameter(name={!r}, dtype={}, default={!r})".format
+_PARAMDECL_FMT = "ParameterDeclaration(names=[{}], parameter={})".format
+_LOCALPARAM_FMT = "LocalParam(name={!r}, dtype={}, value={!r})".format
+_LOCALPARAM_CMT_FMT = "LocalParam(name={!r}, dtype={}, value={!r}, comment={!r})".format
+_LOCALPARAMDECL_FMT = "LocalParamDeclaration(names=[{}], localparam={})".format
+
+
+# Constructors validate with the bare expression `name or _raise(...)` on
+# purpose: it is cheaper than an if/raise block in hot factory loops, so keep
+# it even though linters flag it as expression-not-assigned.
+def _raise(msg: str) -> NoReturn:
+    raise ValueError(msg)
+
+
+def _intern(s: Any) -> Any:
+    """Interns exact str instances; sys.intern rejects str subclasses."""
+    return sys.intern(s) if type(s) is str else s
+
+
+def _payload_eq(a: Any, b: Any) -> bool:
+    """Compares default/value payloads, treating a failing __eq__ as unequal."""
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except (ValueError, TypeError):
+        return False
+
+
+def _init_parameter(obj: "Parameter", name: str, dtype: "DataType", default: Any | None):
+    """Assigns Parameter slots; shared by __init__ and from_records.
+
+    Only cheap work happens here; repr and hash are computed on first use.
+    The _intern check is inlined to save two calls per construction.
+    """
+    name or _raise(_EMPTY_PARAM_NAME_MSG)
+    obj.name = sys.intern(name) if type(name) is str else name
+    obj.dtype = sys.intern(dtype) if type(dtype) is str else dtype
+    obj.default = default
+    obj._str_cache = None
+    obj._hash = None
+
+
+def _init_localparam(obj: "LocalParam", name: str, dtype: "DataType", value: Any,
+                     comment: str | None = None):
+    """Assigns LocalParam slots; shared by __init__ and from_records.
+
+    Mirrors _init_parameter: repr and hash are computed on first use.
+    """
+    name or _raise(_EMPTY_LOCALPARAM_NAME_MSG)
+    obj.name = sys.intern(name) if type(name) is str else name
+    obj.dtype = sys.intern(dtype) if type(dtype) is str else dtype
+    obj.value = value
+    obj.comment = comment
+    obj._fmt = _LOCALPARAM_FMT if comment is None else _LOCALPARAM_CMT_FMT
+    obj._str_cache = None
+    obj._hash = None
 
 
 class Parameter(component.Component):
@@ -31,15 +96,33 @@ class Parameter(component.Component):
         name: String identifier for the parameter in generated code.
         dtype: DataType representing the SystemVerilog data type.
         default: Optional default value for the parameter.
+
+    Instances are immutable once constructed; str() and hash() results are
+    cached and are not refreshed if attributes are reassigned.
     """
 
-    def __init__(self, name: str, dtype: DataType, default: Any | None = None):
+    __slots__ = ("name", "dtype", "default", "_str_cache", "_hash")
+
+    def __init__(self, name: str, dtype: "DataType", default: Any | None = None):
         super().__init__()
-        if not name:
-            raise ValueError("Parameter name cannot be empty")
-        self.name = name
-        self.dtype = dtype
-        self.default = default
+        _init_parameter(self, name, dtype, default)
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[str, "DataType", Any]]) -> Iterator["Parameter"]:
+        """Yields parameters built from (name, dtype, default) tuples.
+
+        Skips the per-instance __init__/super() dispatch when building many
+        parameters in a loop. Subclass __init__ overrides are not run for the
+        yielded objects.
+        """
+        new = object.__new__
+        init_component = component.Component.__init__
+        init = _init_parameter
+        for name, dtype, default in records:
+            obj = new(cls)
+            init_component(obj)
+            init(obj, name, dtype, default)
+            yield obj
 
     @property
     def is_constant(self) -> bool:
@@ -48,8 +131,29 @@ class Parameter(component.Component):
 
     def __str__(self) -> str:
         """Returns string representation of the parameter."""
-        args = f"name={self.name!r}, dtype={self.dtype}, default={self.default!r}"
-        return f"Parameter({args})"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = _PARAM_FMT(self.name, self.dtype, self.default)
+        return s
+
+    def __reduce__(self):
+        """Rebuilds through __init__ so cached hash/str/repr state is recomputed."""
+        return (self.__class__, (self.name, self.dtype, self.default),
+                (getattr(self, "__dict__", None), {"parent": self.parent}))
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self.name, self.dtype))
+        return h
+
+    def __eq__(self, other: Any) -> bool:
+        """Returns True if both parameters share name, dtype and default."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (other.name == self.name
+                and other.dtype == self.dtype
+                and _payload_eq(other.default, self.default))
 
 
 class ParameterDeclaration(component.Component):
@@ -59,21 +163,22 @@ class ParameterDeclaration(component.Component):
     information in the generated SystemVerilog code, improving readability.
 
     Attributes:
-        names: List of parameter names to be declared.
+        names: Tuple of parameter names to be declared.
         parameter: Reference Parameter object containing shared type information.
     """
-    
-    def __init__(self, names: List[str], parameter: Parameter):
+
+    __slots__ = ("names", "parameter", "_joined_repr")
+
+    def __init__(self, names: list[str], parameter: Parameter):
         super().__init__()
-        if not names:
-            raise ValueError("Names list cannot be empty")
-        self.names = names
+        names or _raise(_EMPTY_NAMES_MSG)
+        self.names = tuple(map(_intern, names))
+        self._joined_repr = ", ".join(map(repr, self.names))
         self.parameter = parameter
 
     def __str__(self) -> str:
         """Returns string representation of the parameter declaration."""
-        names_repr = ', '.join(repr(n) for n in self.names)
-        return f"ParameterDeclaration(names=[{names_repr}], parameter={self.parameter})"
+        return _PARAMDECL_FMT(self._joined_repr, self.parameter)
 
 
 class LocalParam(component.Component):
@@ -87,16 +192,40 @@ class LocalParam(component.Component):
         dtype: DataType representing the SystemVerilog data type.
         value: Compile-time constant value for the parameter.
         comment: Optional string describing the parameter's purpose.
+
+    Instances are immutable once constructed; str() and hash() results are
+    cached and are not refreshed if attributes are reassigned.
     """
-    
-    def __init__(self, name: str, dtype: DataType, value: Any, comment: str | None = None):
+
+    __slots__ = ("name", "dtype", "value", "comment", "_fmt", "_str_cache", "_hash")
+
+    def __init__(self, name: str, dtype: "DataType", value: Any, comment: str | None = None):
         super().__init__()
-        if not name:
-            raise ValueError("LocalParam name cannot be empty")
-        self.name = name
-        self.dtype = dtype
-        self.value = value
-        self.comment = comment
+        _init_localparam(self, name, dtype, value, comment)
+
+    @classmethod
+    def from_records(
+            cls, records: Iterable[tuple[str, "DataType", Any] | tuple[str, "DataType", Any, str | None]]
+    ) -> Iterator["LocalParam"]:
+        """Yields local parameters built from (name, dtype, value[, comment]) tuples.
+
+        Skips the per-instance __init__/super() dispatch when building many
+        local parameters in a loop. Subclass __init__ overrides are not run for
+        the yielded objects.
+        """
+        new = object.__new__
+        init_component = component.Component.__init__
+        init = _init_localparam
+        for record in records:
+            if len(record) == 3:
+                name, dtype, value = record
+                comment = None
+            else:
+                name, dtype, value, comment = record
+            obj = new(cls)
+            init_component(obj)
+            init(obj, name, dtype, value, comment)
+            yield obj
 
     @property
     def is_constant(self) -> bool:
@@ -105,10 +234,30 @@ class LocalParam(component.Component):
 
     def __str__(self) -> str:
         """Returns string representation of the local parameter."""
-        args = f"name={self.name!r}, dtype={self.dtype}, value={self.value!r}"
-        if self.comment is not None:
-            args += f", comment={self.comment!r}"
-        return f"LocalParam({args})"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = self._fmt(
+                self.name, self.dtype, self.value, self.comment)
+        return s
+
+    def __reduce__(self):
+        """Rebuilds through __init__ so cached hash/str/repr state is recomputed."""
+        return (self.__class__, (self.name, self.dtype, self.value, self.comment),
+                (getattr(self, "__dict__", None), {"parent": self.parent}))
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self.name, self.dtype, self.comment))
+        return h
+
+    def __eq__(self, other: Any) -> bool:
+        """Returns True if both local parameters share all attributes."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (other.name == self.name
+                and other.dtype == self.dtype and other.comment == self.comment
+                and _payload_eq(other.value, self.value))
 
 
 class LocalParamDeclaration(component.Component):
@@ -118,18 +267,19 @@ class LocalParamDeclaration(component.Component):
     type and value definitions in the generated SystemVerilog code.
 
     Attributes:
-        names: List of local parameter names to be declared.
+        names: Tuple of local parameter names to be declared.
         localparam: Reference LocalParam object containing shared information.
     """
-    
-    def __init__(self, names: List[str], localparam: LocalParam):
+
+    __slots__ = ("names", "localparam", "_joined_repr")
+
+    def __init__(self, names: list[str], localparam: LocalParam):
         super().__init__()
-        if not names:
-            raise ValueError("Names list cannot be empty")
-        self.names = names
+        names or _raise(_EMPTY_NAMES_MSG)
+        self.names = tuple(map(_intern, names))
+        self._joined_repr = ", ".join(map(repr, self.names))
         self.localparam = localparam
 
     def __str__(self) -> str:
         """Returns string representation of the local parameter declaration."""
-        names_repr = ', '.join(repr(n) for n in self.names)
-        return f"LocalParamDeclaration(names=[{names_repr}], localparam={self.localparam})"
+        return _LOCALPARAMDECL_FMT(self._joined_repr, self.localparam)
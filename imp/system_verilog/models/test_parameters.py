@@ -0,0 +1,228 @@
+"""
+
+Copyright 2023 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import copy
+import pickle
+
+import pytest
+
+from imp.system_verilog.models import datatypes
+from imp.system_verilog.models import modules
+from imp.system_verilog.models import parameters
+
+
+def test_parameter_str():
+  dtype = datatypes.IntType()
+  p = parameters.Parameter("WIDTH", dtype, 32)
+  assert str(p) == f"Parameter(name='WIDTH', dtype={dtype}, default=32)"
+
+  decl = parameters.ParameterDeclaration(["WIDTH", "DEPTH"], p)
+  assert str(decl) == f"ParameterDeclaration(names=['WIDTH', 'DEPTH'], parameter={p})"
+
+
+def test_localparam_str():
+  dtype = datatypes.IntType()
+  p = parameters.LocalParam("p1", dtype, 30)
+  assert str(p) == f"LocalParam(name='p1', dtype={dtype}, value=30)"
+
+  p = parameters.LocalParam("p2", dtype, 30, comment="note")
+  assert str(p) == f"LocalParam(name='p2', dtype={dtype}, value=30, comment='note')"
+
+  decl = parameters.LocalParamDeclaration(["p2"], p)
+  assert str(decl) == f"LocalParamDeclaration(names=['p2'], localparam={p})"
+
+
+def test_parameter_str_is_cached():
+  p = parameters.Parameter("WIDTH", datatypes.IntType(), 32)
+  assert str(p) is str(p)
+
+  lp = parameters.LocalParam("p1", datatypes.IntType(), 30)
+  assert str(lp) is str(lp)
+
+
+def test_parameters_have_no_instance_dict():
+  p = parameters.Parameter("WIDTH", datatypes.IntType(), 32)
+  decl = parameters.ParameterDeclaration(["WIDTH"], p)
+  lp = parameters.LocalParam("p1", datatypes.IntType(), 30)
+  lp_decl = parameters.LocalParamDeclaration(["p1"], lp)
+  for item in (p, decl, lp, lp_decl):
+    assert not hasattr(item, "__dict__")
+
+
+def test_parameter_names_are_interned():
+  name = "".join(["WID", "TH"])
+  p = parameters.Parameter(name, datatypes.IntType(), 32)
+  decl = parameters.ParameterDeclaration([name], p)
+  assert p.name is decl.names[0]
+
+
+def test_empty_names_are_rejected():
+  dtype = datatypes.IntType()
+  with pytest.raises(ValueError, match="Parameter name cannot be empty"):
+    parameters.Parameter("", dtype)
+  with pytest.raises(ValueError, match="LocalParam name cannot be empty"):
+    parameters.LocalParam("", dtype, 0)
+  with pytest.raises(ValueError, match="Names list cannot be empty"):
+    parameters.ParameterDeclaration([], parameters.Parameter("p", dtype))
+  with pytest.raises(ValueError, match="Names list cannot be empty"):
+    parameters.LocalParamDeclaration([], parameters.LocalParam("p", dtype, 0))
+
+
+def test_declaration_names_are_frozen():
+  names = ["p1", "p2"]
+  decl = parameters.LocalParamDeclaration(
+      names, parameters.LocalParam("p1", datatypes.IntType(), 0))
+  names.append("p3")
+  assert decl.names == ("p1", "p2")
+
+
+def test_parameters_compare_structurally():
+  dtype = datatypes.IntType()
+  p1 = parameters.Parameter("WIDTH", dtype, 32)
+  p2 = parameters.Parameter("WIDTH", dtype, 32)
+  p3 = parameters.Parameter("WIDTH", dtype, 16)
+  assert p1 == p2 and hash(p1) == hash(p2)
+  assert p1 != p3
+  assert len({p1, p2, p3}) == 2
+
+  lp1 = parameters.LocalParam("p1", dtype, [1, 2])
+  lp2 = parameters.LocalParam("p1", dtype, [1, 2])
+  lp3 = parameters.LocalParam("p1", dtype, [1, 2], comment="note")
+  assert lp1 == lp2 and hash(lp1) == hash(lp2)
+  assert lp1 != lp3
+  assert lp1 != p1
+
+
+def test_from_records_matches_constructor():
+  dtype = datatypes.IntType()
+  params = list(parameters.Parameter.from_records(
+      [("WIDTH", dtype, 32), ("DEPTH", dtype, None)]))
+  assert params == [
+      parameters.Parameter("WIDTH", dtype, 32),
+      parameters.Parameter("DEPTH", dtype),
+  ]
+  assert str(params[0]) == str(parameters.Parameter("WIDTH", dtype, 32))
+  assert params[0].parent is None
+
+  localparams = list(parameters.LocalParam.from_records(
+      [("p1", dtype, 30), ("p2", dtype, 1, "note")]))
+  assert localparams == [
+      parameters.LocalParam("p1", dtype, 30),
+      parameters.LocalParam("p2", dtype, 1, comment="note"),
+  ]
+  assert str(localparams[1]) == str(parameters.LocalParam("p2", dtype, 1, comment="note"))
+
+  with pytest.raises(ValueError, match="Parameter name cannot be empty"):
+    list(parameters.Parameter.from_records([("", dtype, 0)]))
+
+
+def test_str_subclass_names_are_accepted():
+
+  class Name(str):
+    pass
+
+  dtype = datatypes.IntType()
+  name = Name("WIDTH")
+  p = parameters.Parameter(name, dtype, 32)
+  lp = parameters.LocalParam(name, Name("int"), 1)
+  decl = parameters.ParameterDeclaration([name], p)
+  assert p.name is name and lp.name is name and decl.names[0] is name
+  assert next(parameters.Parameter.from_records([(name, dtype, 32)])).name is name
+
+
+def test_equality_compares_payloads():
+  dtype = datatypes.IntType()
+  p1 = parameters.Parameter("P", dtype, {"a": 1, "b": 2})
+  p2 = parameters.Parameter("P", dtype, {"b": 2, "a": 1})
+  assert p1 == p2 and hash(p1) == hash(p2)
+
+  class Truncated:
+    def __init__(self, data):
+      self.data = data
+
+    def __eq__(self, other):
+      return self.data == other.data
+
+    def __repr__(self):
+      return "array([0, 0, ..., 0])"
+
+  p1 = parameters.Parameter("P", dtype, Truncated([0] * 1000))
+  p2 = parameters.Parameter("P", dtype, Truncated([0] * 999 + [1]))
+  assert str(p1) == str(p2)
+  assert p1 != p2
+  assert len({p1, p2}) == 2
+
+
+def test_equality_guards_elementwise_payload_eq():
+
+  class ArrayLike:
+    def __eq__(self, other):
+      raise ValueError("The truth value of an array is ambiguous")
+
+    __hash__ = object.__hash__
+
+  dtype = datatypes.IntType()
+  payload = ArrayLike()
+  p1 = parameters.Parameter("WIDTH", dtype, payload)
+  assert p1 == parameters.Parameter("WIDTH", dtype, payload)
+  p2 = parameters.Parameter("WIDTH", dtype, ArrayLike())
+  assert p1 != p2
+  assert p2 not in [p1]
+
+  lp1 = parameters.LocalParam("p1", dtype, payload)
+  assert lp1 == parameters.LocalParam("p1", dtype, payload)
+  assert lp1 != parameters.LocalParam("p1", dtype, ArrayLike())
+
+
+def test_copies_rebuild_cached_state():
+  for p in (parameters.Parameter("WIDTH", datatypes.IntType(), 32),
+            parameters.LocalParam("p1", datatypes.IntType(), 30, comment="note")):
+    for q in (copy.deepcopy(p), pickle.loads(pickle.dumps(p))):
+      fresh = copy.copy(q)
+      assert q is not p and q.dtype is not p.dtype
+      assert q == fresh and hash(q) == hash(fresh)
+      assert fresh in {q}
+      assert str(q) == str(fresh)
+
+
+def test_copies_keep_parent():
+  m = modules.Module(module_name="example")
+  m.localparam(name="p1", dtype=datatypes.IntType(), value=30)
+  lp = m.p1
+  lp.set_parent(m)
+
+  lp_copy = pickle.loads(pickle.dumps(lp))
+  assert lp_copy.parent.p1 is lp_copy
+  assert copy.deepcopy(lp).parent is not None
+
+
+class TaggedParameter(parameters.Parameter):
+  """Subclass without __slots__, so instances carry a __dict__."""
+
+
+class TaggedLocalParam(parameters.LocalParam):
+  """Subclass without __slots__, so instances carry a __dict__."""
+
+
+def test_copies_keep_subclass_attributes():
+  for p in (TaggedParameter("WIDTH", datatypes.IntType(), 32),
+            TaggedLocalParam("p1", datatypes.IntType(), 30)):
+    p.tag = "bus"
+    for q in (copy.copy(p), copy.deepcopy(p), pickle.loads(pickle.dumps(p))):
+      assert type(q) is type(p)
+      assert q.tag == "bus"